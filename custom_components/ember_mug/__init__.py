@@ -63,6 +63,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data.get(CONF_NAME, entry.title),
     )
 
+    entry.async_on_unload(mug_coordinator.async_cancel_callbacks)
+
     startup_event = asyncio.Event()
     cancel_first_update = mug_coordinator.mug.register_callback(
         lambda *_: startup_event.set(),
@@ -107,9 +109,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         mug_coordinator,
     )
 
-    await set_temperature_unit(mug_coordinator, entry.data[CONF_TEMPERATURE_UNIT])
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    setup_tasks = [hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)]
+    if temperature_unit := entry.data.get(CONF_TEMPERATURE_UNIT):
+        # Entities don't depend on the unit, so set it while they are set up
+        setup_tasks.append(set_temperature_unit(mug_coordinator, temperature_unit))
+    await asyncio.gather(*setup_tasks)
 
     async def _async_stop(event: Event) -> None:
         """Close the connection."""
@@ -135,6 +140,13 @@ async def set_temperature_unit(
             await mug_coordinator.mug.set_temperature_unit(unit)
     except (BleakError, TimeoutError, EOFError) as e:
         _LOGGER.warning("Unable to set temperature unit to %s: %s.", unit, e)
+        return
+    except Exception as e:
+        # This runs alongside platform setup, so don't let it fail the entry
+        _LOGGER.error("Unexpected error setting temperature unit to %s: %s", unit, e)
+        return
+    # Entities may already have written their state with the old unit
+    mug_coordinator.async_update_listeners()
 
 
 async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -1,8 +1,12 @@
 """Coordinator for all the sensors."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+from operator import attrgetter
+from time import monotonic
 from typing import Any
 
 from bleak_retry_connector import close_stale_connections
@@ -19,6 +23,16 @@ from .const import MANUFACTURER
 
 _LOGGER = logging.getLogger(__name__)
 
+# The mug pushes events for the attributes that change while in use, so only
+# poll everything occasionally to catch anything that may have been missed.
+FULL_UPDATE_INTERVAL = timedelta(minutes=5).total_seconds()
+
+
+@lru_cache
+def _mug_attr_getter(mug_attr: str) -> attrgetter:
+    """Build (and reuse) a getter for a dotted mug attribute."""
+    return attrgetter(mug_attr)
+
 
 class MugDataUpdateCoordinator(DataUpdateCoordinator[MugData]):
     """Class to manage fetching Mug data."""
@@ -44,37 +58,71 @@ class MugDataUpdateCoordinator(DataUpdateCoordinator[MugData]):
         self.data = self.mug.data
         self.available = False
         self._initial_update = True
-        self.last_updated: datetime | None = None
-        self._last_refresh_was_full = False
-        _LOGGER.info(f"Ember Mug {self.name} Setup")
+        self.last_changed: datetime | None = None
+        self._last_full_update: float | None = None
+        self._cancel_callback: Callable[[], None] | None = None
+        self._skip_listener_update = False
+        self._refreshing = False
+        self._updating = False
+        self._callback_during_update = False
+        self._device_info: DeviceInfo | None = None
+        self._device_info_key: tuple[Any, ...] = ()
+        _LOGGER.info("Ember Mug %s Setup", self.name)
 
     async def _async_update_data(self) -> MugData:
         """Poll the device."""
+        self._updating = True
+        try:
+            return await self._async_update_mug()
+        finally:
+            self._updating = False
+
+    async def _async_update_mug(self) -> MugData:
+        """Read the attributes that are due from the mug."""
         _LOGGER.debug("Updating")
-        full_update = not self._last_refresh_was_full
+        self._skip_listener_update = False
+        self._callback_during_update = False
+        was_available = self.available
+        now = datetime.now()
+        # Reading the queue alone never connects, so do a full update to
+        # (re)connect and resubscribe after the mug was unavailable or failed.
+        full_update = (
+            not self.available
+            or not self.last_update_success
+            or self._last_full_update is None
+            or monotonic() - self._last_full_update >= FULL_UPDATE_INTERVAL
+        )
         try:
             changed = []
             if self._initial_update is True:
                 changed = await self.mug.update_initial()
                 self._initial_update = False
-            if self._last_refresh_was_full is False:
-                # Only fully poll all data every other call to limit time
+            if full_update:
                 changed += await self.mug.update_all()
+                self._last_full_update = monotonic()
             else:
+                # Only read attributes the mug has notified us about (if any)
                 changed += await self.mug.update_queued_attributes()
-            self._last_refresh_was_full = not self._last_refresh_was_full
             self.available = True
-            self.last_updated = datetime.now()
         except Exception as e:
-            _LOGGER.error("An error occurred whilst updating the mug: %s", e)
+            # The coordinator logs the failure once until the mug recovers
+            _LOGGER.debug("An error occurred whilst updating the mug: %s", e)
             self.available = False
-            raise UpdateFailed(f"An error occurred updating mug: {e=}")
+            raise UpdateFailed(f"An error occurred updating mug: {e=}") from e
 
-        # Ensure callbacks are registered
-        self._cancel_callback = self.mug.register_callback(
-            self._async_handle_callback,
+        if changed:
+            self.last_changed = now
+
+        # Nothing for the entities to write if the data and availability are the same
+        self._skip_listener_update = (
+            was_available and not changed and not self._callback_during_update
         )
 
+        if self._cancel_callback is None:
+            self._cancel_callback = self.mug.register_callback(
+                self._async_handle_callback,
+            )
+
         _LOGGER.debug(
             "[%s Update] Changed: %s",
             "Full" if full_update else "Partial",
@@ -82,6 +130,22 @@ class MugDataUpdateCoordinator(DataUpdateCoordinator[MugData]):
         )
         return self.mug.data
 
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh the data, only skipping listener updates in here."""
+        self._refreshing = True
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self._refreshing = False
+            self._skip_listener_update = False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners unless the refresh didn't change anything."""
+        if self._refreshing and self._skip_listener_update:
+            return
+        super().async_update_listeners()
+
     @callback
     def handle_unavailable(
         self,
@@ -106,29 +170,44 @@ class MugDataUpdateCoordinator(DataUpdateCoordinator[MugData]):
         )
         self.mug.set_device(service_info.device)
         # self.hass.loop.create_task(self.async_request_refresh())
-        self.hass.loop.create_task(close_stale_connections(service_info.device))
+        if not self.available:
+            # Only clean up if we aren't already talking to the mug
+            self.hass.loop.create_task(close_stale_connections(service_info.device))
 
     @callback
     def _async_handle_callback(self, mug_data: MugData) -> None:
         """Handle a Bluetooth event."""
         _LOGGER.debug("Callback called in Home Assistant")
+        self.last_changed = datetime.now()
+        if self._updating:
+            # The refresh in progress will update the listeners itself
+            self._callback_during_update = True
+            return
         self.async_set_updated_data(mug_data)
 
+    @callback
+    def async_cancel_callbacks(self) -> None:
+        """Stop handling callbacks from the mug."""
+        if self._cancel_callback is not None:
+            self._cancel_callback()
+            self._cancel_callback = None
+
     def get_mug_attr(self, mug_attr: str) -> Any:
         """Get a mug attribute by name (recursively) or return None."""
-        value = self.data
-        for attr in mug_attr.split("."):
-            try:
-                value = getattr(value, attr)
-            except AttributeError:
-                return None
-        return value
+        try:
+            return _mug_attr_getter(mug_attr)(self.data)
+        except AttributeError:
+            return None
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return information about the mug."""
         firmware = self.data.firmware
-        return DeviceInfo(
+        key = (self.data.name, self.data.model, firmware)
+        if self._device_info is not None and key == self._device_info_key:
+            return self._device_info
+        self._device_info_key = key
+        self._device_info = DeviceInfo(
             connections={(CONNECTION_BLUETOOTH, self.mug.device.address)},
             name=name if (name := self.data.name) != "EMBER" else self.device_name,
             model=self.data.model,
@@ -137,3 +216,4 @@ class MugDataUpdateCoordinator(DataUpdateCoordinator[MugData]):
             sw_version=str(firmware.version) if firmware else None,
             manufacturer=MANUFACTURER,
         )
+        return self._device_info
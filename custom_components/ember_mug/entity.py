@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from ember_mug.consts import TemperatureUnit
 from homeassistant.core import callback
@@ -47,26 +46,26 @@ class BaseMugEntity(CoordinatorEntity):
         super().__init__(coordinator)
         entity_key = self.entity_description.key
         self._mug_attr = mug_attr
-        self._address = coordinator.mug.device.address
         self._attr_device_info = coordinator.device_info
         self._attr_unique_id = f"ember_mug_{coordinator.base_unique_id}_{entity_key}"
         self.entity_id = f"{self._domain}.{self._attr_unique_id}"
 
+    async def async_added_to_hass(self) -> None:
+        """Update attributes once listening to the coordinator."""
+        await super().async_added_to_hass()
+        self._async_update_attrs()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.available
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        return {
-            "last_updated": self.coordinator.last_updated,
-        }
-
     @callback
     def _async_update_attrs(self) -> None:
         """Update the entity attributes."""
+        self._attr_extra_state_attributes = {
+            "last_changed": self.coordinator.last_changed,
+        }
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -78,7 +77,8 @@ class BaseMugEntity(CoordinatorEntity):
 class BaseMugValueEntity(BaseMugEntity):
     """Base Entity that returns a mug attribute as its `native_value`."""
 
-    @property
-    def native_value(self) -> Any:
-        """Return a mug attribute as the state for the sensor."""
-        return self.coordinator.get_mug_attr(self._mug_attr)
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the native value from the mug attribute."""
+        super()._async_update_attrs()
+        self._attr_native_value = self.coordinator.get_mug_attr(self._mug_attr)
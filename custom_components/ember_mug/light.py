@@ -36,6 +36,7 @@ class MugLightEntity(BaseMugEntity, LightEntity):
     @callback
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
+        super()._async_update_attrs()
         self._attr_is_on = (
             self.coordinator.available
         )  # it's always on, if the mug is there.
@@ -45,7 +46,7 @@ class MugLightEntity(BaseMugEntity, LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Change the LED colour if defined."""
-        _LOGGER.debug(f"Received turn on with {kwargs}")
+        _LOGGER.debug("Received turn on with %s", kwargs)
         if ATTR_RGB_COLOR in kwargs:
             rgb = kwargs[ATTR_RGB_COLOR]
             await self.coordinator.mug.set_led_colour(Colour(*rgb))
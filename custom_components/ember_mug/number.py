@@ -58,6 +58,8 @@ class MugTargetTempNumberEntity(MugNumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the mug target temp."""
         await self.coordinator.mug.set_target_temp(value)
+        self._attr_native_value = value
+        self.async_write_ha_state()
 
 
 async def async_setup_entry(
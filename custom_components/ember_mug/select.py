@@ -72,6 +72,7 @@ class MugTempUnitSelectEntity(MugSelectEntity):
     ) -> None:
         """Change the selected option."""
         await self.coordinator.mug.set_temperature_unit(option)
+        self.async_write_ha_state()
 
 
 async def async_setup_entry(
@@ -1,8 +1,11 @@
 """Sensor Entity for Ember Mug."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
+from ember_mug.data import MugData
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -11,7 +14,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_BATTERY_CHARGING, PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -27,33 +30,97 @@ from .const import (
     LiquidStateValue,
 )
 from .coordinator import MugDataUpdateCoordinator
-from .entity import BaseMugValueEntity
+from .entity import BaseMugEntity
 from .models import HassMugData
 
+
+@dataclass
+class MugSensorRequiredKeysMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[MugData], Any]
+
+
+@dataclass
+class MugSensorEntityDescription(
+    SensorEntityDescription,
+    MugSensorRequiredKeysMixin,
+):
+    """Sensor description with functions to get the value and attributes."""
+
+    attrs_fn: Callable[[MugData], dict[str, Any]] | None = None
+
+
+def _liquid_state_attrs(data: MugData) -> dict[str, Any]:
+    """Return state attributes for the liquid state."""
+    attrs = {
+        "firmware_info": data.firmware,
+        "raw_state": data.liquid_state,
+    }
+    if data.include_extra:
+        attrs |= {
+            "date_time_zone": data.date_time_zone,
+            "udsk": data.udsk,
+            "dsk": data.dsk,
+        }
+    return attrs
+
+
+def _liquid_state_value(data: MugData) -> str | None:
+    """Return the liquid state key."""
+    if state := data.liquid_state:
+        return LIQUID_STATE_MAPPING[state].value
+    return None
+
+
+def _liquid_level_percent(data: MugData) -> float | int:
+    """Convert the raw liquid level to a percentage."""
+    # 30 -> Full
+    # 5, 6 -> Low
+    # 0 -> Empty
+    return data.liquid_level / 30 * 100 if data.liquid_level else 0
+
+
+def _battery_attrs(data: MugData) -> dict[str, Any]:
+    """Return state attributes for the battery."""
+    attrs = {
+        ATTR_BATTERY_CHARGING: data.battery.on_charging_base if data.battery else None,
+    }
+    if data.include_extra:
+        attrs[ATTR_BATTERY_VOLTAGE] = data.battery_voltage
+    return attrs
+
+
 SENSOR_TYPES = {
-    "liquid_state": SensorEntityDescription(
+    "liquid_state": MugSensorEntityDescription(
         key="state",
         name="State",
         translation_key="liquid_state",
         device_class=SensorDeviceClass.ENUM,
         options=LIQUID_STATE_OPTIONS,
+        value_fn=_liquid_state_value,
+        attrs_fn=_liquid_state_attrs,
     ),
-    "liquid_level": SensorEntityDescription(
+    "liquid_level": MugSensorEntityDescription(
         key="liquid_level",
         name="Liquid Level",
         icon="mdi:cup-water",
         native_precision=0,
         native_unit_of_measurement=PERCENTAGE,
+        value_fn=_liquid_level_percent,
+        attrs_fn=lambda data: {"raw_liquid_level": data.liquid_level},
     ),
-    "current_temp": SensorEntityDescription(
+    "current_temp": MugSensorEntityDescription(
         key="current_temp",
         name="Current Temperature",
         native_precision=1,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
+        value_fn=lambda data: data.current_temp,
+        attrs_fn=lambda data: {"native_value": data.current_temp},
     ),
-    "battery.percent": SensorEntityDescription(
+    "battery.percent": MugSensorEntityDescription(
         key="battery_percent",
         name="Battery",
         native_precision=1,
@@ -61,14 +128,17 @@ SENSOR_TYPES = {
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data.battery.percent if data.battery else None,
+        attrs_fn=_battery_attrs,
     ),
 }
 
 
-class EmberMugSensor(BaseMugValueEntity, SensorEntity):
+class EmberMugSensor(BaseMugEntity, SensorEntity):
     """Representation of a Mug sensor."""
 
     _domain = "sensor"
+    entity_description: MugSensorEntityDescription
 
     def __init__(
         self,
@@ -79,6 +149,16 @@ class EmberMugSensor(BaseMugValueEntity, SensorEntity):
         self.entity_description = SENSOR_TYPES[mug_attr]
         super().__init__(coordinator, mug_attr)
 
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the value and attributes using the entity description."""
+        super()._async_update_attrs()
+        description = self.entity_description
+        data = self.coordinator.data
+        self._attr_native_value = description.value_fn(data)
+        if description.attrs_fn is not None:
+            self._attr_extra_state_attributes |= description.attrs_fn(data)
+
 
 class EmberMugStateSensor(EmberMugSensor):
     """Base Mug State Sensor."""
@@ -96,53 +176,6 @@ class EmberMugStateSensor(EmberMugSensor):
             case _:
                 return ICON_DEFAULT
 
-    @property
-    def native_value(self) -> str | None:
-        """Return liquid state key."""
-        state = super().native_value
-        if state:
-            return LIQUID_STATE_MAPPING[state].value
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return device specific state attributes."""
-        data = self.coordinator.data
-        attrs = {
-            "firmware_info": data.firmware,
-            "raw_state": data.liquid_state,
-        }
-        if data.include_extra:
-            attrs |= {
-                "date_time_zone": data.date_time_zone,
-                "udsk": data.udsk,
-                "dsk": data.dsk,
-            }
-        return attrs | super().extra_state_attributes
-
-
-class EmberMugLiquidLevelSensor(EmberMugSensor):
-    """Liquid Level Sensor."""
-
-    @property
-    def native_value(self) -> float | int:
-        """Return information about the liquid level."""
-        liquid_level: float | None = super().native_value
-        if liquid_level:
-            # 30 -> Full
-            # 5, 6 -> Low
-            # 0 -> Empty
-            return liquid_level / 30 * 100
-        return 0
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return device specific state attributes."""
-        return {
-            "raw_liquid_level": self.coordinator.data.liquid_level,
-            **super().extra_state_attributes,
-        }
-
 
 class EmberMugTemperatureSensor(EmberMugSensor):
     """Mug Temperature sensor."""
@@ -158,31 +191,6 @@ class EmberMugTemperatureSensor(EmberMugSensor):
         )
         return f"mdi:{icon}"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return device specific state attributes."""
-        return {
-            "native_value": self.coordinator.data.current_temp,
-            **super().extra_state_attributes,
-        }
-
-
-class EmberMugBatterySensor(EmberMugSensor):
-    """Mug Battery Sensor."""
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return device specific state attributes."""
-        data = self.coordinator.data
-        attrs = {
-            ATTR_BATTERY_CHARGING: data.battery.on_charging_base
-            if data.battery
-            else None,
-        }
-        if data.include_extra:
-            attrs[ATTR_BATTERY_VOLTAGE] = data.battery_voltage
-        return attrs | super().extra_state_attributes
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -195,8 +203,8 @@ async def async_setup_entry(
     assert entry_id is not None
     entities: list[EmberMugSensor] = [
         EmberMugStateSensor(data.coordinator, "liquid_state"),
-        EmberMugLiquidLevelSensor(data.coordinator, "liquid_level"),
+        EmberMugSensor(data.coordinator, "liquid_level"),
         EmberMugTemperatureSensor(data.coordinator, "current_temp"),
-        EmberMugBatterySensor(data.coordinator, "battery.percent"),
+        EmberMugSensor(data.coordinator, "battery.percent"),
     ]
     async_add_entities(entities)
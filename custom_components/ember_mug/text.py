@@ -45,6 +45,8 @@ class MugTextEntity(BaseMugValueEntity, TextEntity):
     async def async_set_value(self, value: str) -> None:
         """Set the mug name."""
         await self.coordinator.mug.set_name(value)
+        self._attr_native_value = value
+        self.async_write_ha_state()
 
 
 async def async_setup_entry(
@@ -1,6 +1,11 @@
 """Configure pytest."""
+from unittest.mock import AsyncMock, MagicMock
+
+from ember_mug.data import MugData
 import pytest
 
+from tests import MUG_DEVICE_NAME, MUG_SERVICE_INFO
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
@@ -13,3 +18,15 @@ def auto_enable_custom_integrations(enable_custom_integrations):
 @pytest.fixture(autouse=True)
 def mock_bluetooth(enable_bluetooth):
     """Auto mock bluetooth."""
+
+
+@pytest.fixture
+def mock_mug() -> MagicMock:
+    """Mock an Ember Mug that doesn't need a connection."""
+    mug = MagicMock()
+    mug.data = MugData(MUG_DEVICE_NAME)
+    mug.device = MUG_SERVICE_INFO.device
+    mug.update_initial = AsyncMock(return_value=[])
+    mug.update_all = AsyncMock(return_value=[])
+    mug.update_queued_attributes = AsyncMock(return_value=[])
+    return mug
@@ -0,0 +1,181 @@
+"""Test the Mug data update coordinator."""
+import logging
+from unittest.mock import MagicMock
+
+from bleak import BleakError
+from ember_mug.data import Change
+from homeassistant.core import HomeAssistant
+
+from custom_components.ember_mug.coordinator import MugDataUpdateCoordinator
+
+from tests import MUG_SERVICE_INFO, TEST_MUG_NAME
+
+
+def _coordinator(hass: HomeAssistant, mug: MagicMock) -> MugDataUpdateCoordinator:
+    return MugDataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        mug,
+        "aabbccddeeff",
+        TEST_MUG_NAME,
+    )
+
+
+async def test_full_update_after_unavailable(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test a full update (and reconnect) is done when the mug was unavailable."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    assert mock_mug.update_all.await_count == 1
+
+    # Between heartbeats only the queued attributes are read
+    await coordinator.async_refresh()
+    assert mock_mug.update_all.await_count == 1
+    assert mock_mug.update_queued_attributes.await_count == 1
+
+    coordinator.handle_unavailable(MUG_SERVICE_INFO)
+    await coordinator.async_refresh()
+    assert mock_mug.update_all.await_count == 2
+    assert coordinator.available is True
+
+
+async def test_full_update_after_failure(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test a full update is done after a failed refresh."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+
+    mock_mug.update_queued_attributes.side_effect = BleakError("Disconnected")
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is False
+    assert coordinator.available is False
+
+    await coordinator.async_refresh()
+    assert mock_mug.update_all.await_count == 2
+    assert coordinator.available is True
+
+
+async def test_callbacks_during_refresh_not_pushed(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test callbacks fired by the refresh itself don't update listeners again."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    async def _update_all() -> list[Change]:
+        coordinator._async_handle_callback(mock_mug.data)
+        return [Change("current_temp", 0, 50)]
+
+    mock_mug.update_all.side_effect = _update_all
+    coordinator.handle_unavailable(MUG_SERVICE_INFO)
+    listener.reset_mock()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert listener.call_count == 1
+    unsub()
+
+
+async def test_callback_during_refresh_not_lost(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test a callback during a refresh without read changes still updates listeners."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    async def _update_queued_attributes() -> list[Change]:
+        # e.g. the charger was connected whilst reading
+        coordinator._async_handle_callback(mock_mug.data)
+        return []
+
+    mock_mug.update_queued_attributes.side_effect = _update_queued_attributes
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+    unsub()
+
+
+async def test_cancel_callbacks(hass: HomeAssistant, mock_mug: MagicMock) -> None:
+    """Test the mug callback is unregistered when cancelled."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    coordinator.async_cancel_callbacks()
+    mock_mug.register_callback.return_value.assert_called_once()
+
+
+async def test_listener_update_skipped_without_changes(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test listeners are only updated when the refresh changed something."""
+    coordinator = _coordinator(hass, mock_mug)
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    # First refresh makes the mug available
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+
+    # Nothing changed
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+    assert coordinator.last_changed is None
+
+    # Other callers still update the listeners
+    coordinator.async_update_listeners()
+    assert listener.call_count == 2
+
+    mock_mug.update_queued_attributes.return_value = [Change("liquid_level", 0, 30)]
+    await coordinator.async_refresh()
+    assert listener.call_count == 3
+    assert coordinator.last_changed is not None
+    unsub()
+
+
+async def test_listener_update_after_recovery(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test listeners are updated when availability changes without data changes."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    coordinator.handle_unavailable(MUG_SERVICE_INFO)
+    assert listener.call_count == 1
+
+    await coordinator.async_refresh()
+    assert coordinator.available is True
+    assert listener.call_count == 2
+    unsub()
+
+
+async def test_listener_update_not_swallowed(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> None:
+    """Test a skipped refresh doesn't swallow later listener updates."""
+    coordinator = _coordinator(hass, mock_mug)
+    await coordinator.async_refresh()
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    assert listener.call_count == 0
+
+    coordinator.async_set_updated_data(mock_mug.data)
+    assert listener.call_count == 1
+
+    await coordinator.async_refresh()
+    coordinator.handle_unavailable(MUG_SERVICE_INFO)
+    assert listener.call_count == 2
+    unsub()
@@ -0,0 +1,107 @@
+"""Test the Mug sensors."""
+import logging
+from unittest.mock import MagicMock, patch
+
+from ember_mug.consts import LiquidState
+from ember_mug.data import BatteryInfo, MugFirmwareInfo
+from homeassistant.const import ATTR_BATTERY_CHARGING
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ember_mug.const import ATTR_BATTERY_VOLTAGE, LiquidStateValue
+from custom_components.ember_mug.coordinator import MugDataUpdateCoordinator
+from custom_components.ember_mug.sensor import EmberMugSensor, EmberMugStateSensor
+
+from tests import TEST_MUG_NAME
+
+
+@pytest.fixture
+def coordinator(
+    hass: HomeAssistant,
+    mock_mug: MagicMock,
+) -> MugDataUpdateCoordinator:
+    """Coordinator for the mocked mug."""
+    return MugDataUpdateCoordinator(
+        hass,
+        logging.getLogger(__name__),
+        mock_mug,
+        "aabbccddeeff",
+        TEST_MUG_NAME,
+    )
+
+
+def _update(coordinator: MugDataUpdateCoordinator, sensor: EmberMugSensor) -> None:
+    """Push the mug data to the sensor like a coordinator update."""
+    unsub = coordinator.async_add_listener(sensor._handle_coordinator_update)
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        coordinator.async_set_updated_data(coordinator.mug.data)
+    mock_write.assert_called_once()
+    unsub()
+
+
+async def test_liquid_state_sensor(
+    coordinator: MugDataUpdateCoordinator,
+    mock_mug: MagicMock,
+) -> None:
+    """Test the liquid state is mapped and extra attributes are optional."""
+    sensor = EmberMugStateSensor(coordinator, "liquid_state")
+    firmware = MugFirmwareInfo(version=1, hardware=2, bootloader=3)
+    mock_mug.data.firmware = firmware
+    mock_mug.data.liquid_state = LiquidState.TARGET_TEMPERATURE
+    mock_mug.data.udsk = "udsk"
+    _update(coordinator, sensor)
+    assert sensor.native_value == LiquidStateValue.PERFECT
+    assert sensor.extra_state_attributes == {
+        "last_changed": coordinator.last_changed,
+        "firmware_info": firmware,
+        "raw_state": LiquidState.TARGET_TEMPERATURE,
+    }
+
+    mock_mug.data.include_extra = True
+    mock_mug.data.liquid_state = LiquidState.UNKNOWN
+    _update(coordinator, sensor)
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes["udsk"] == "udsk"
+    assert sensor.extra_state_attributes["dsk"] == ""
+    assert sensor.extra_state_attributes["date_time_zone"] == ""
+
+
+async def test_liquid_level_sensor(
+    coordinator: MugDataUpdateCoordinator,
+    mock_mug: MagicMock,
+) -> None:
+    """Test the raw liquid level is converted to a percentage."""
+    sensor = EmberMugSensor(coordinator, "liquid_level")
+    mock_mug.data.liquid_level = 15
+    _update(coordinator, sensor)
+    assert sensor.native_value == 50
+    assert sensor.extra_state_attributes["raw_liquid_level"] == 15
+
+    mock_mug.data.liquid_level = 30
+    _update(coordinator, sensor)
+    assert sensor.native_value == 100
+
+    mock_mug.data.liquid_level = 0
+    _update(coordinator, sensor)
+    assert sensor.native_value == 0
+
+
+async def test_battery_sensor(
+    coordinator: MugDataUpdateCoordinator,
+    mock_mug: MagicMock,
+) -> None:
+    """Test the battery sensor before and after the battery is read."""
+    sensor = EmberMugSensor(coordinator, "battery.percent")
+    mock_mug.data.battery = None
+    _update(coordinator, sensor)
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes[ATTR_BATTERY_CHARGING] is None
+    assert ATTR_BATTERY_VOLTAGE not in sensor.extra_state_attributes
+
+    mock_mug.data.battery = BatteryInfo(percent=55.5, on_charging_base=True)
+    mock_mug.data.include_extra = True
+    mock_mug.data.battery_voltage = "3.8v"
+    _update(coordinator, sensor)
+    assert sensor.native_value == 55.5
+    assert sensor.extra_state_attributes[ATTR_BATTERY_CHARGING] is True
+    assert sensor.extra_state_attributes[ATTR_BATTERY_VOLTAGE] == "3.8v"